@@ -9,78 +9,135 @@ Only values matching the regex pattern ^S-\d{5,6}$ are copied.
 """
 
 import os
+import functools
 import re
 import sys
+import time
 import logging
+import logging.handlers
+import queue
+import threading
 import requests
-from typing import List, Optional, Dict, Any
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from collections import Counter
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from enum import IntEnum
+from typing import List, Optional, Dict, Any, Iterator, Set, Tuple
 from dotenv import load_dotenv
-from jira import JIRA
 from jira.exceptions import JIRAError
-from jira.resources import Issue
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('bulk_edit.log'),
-        logging.StreamHandler(sys.stdout)
-    ]
-)
-logger = logging.getLogger(__name__)
 
-# Load environment variables
-load_dotenv()
+# orjson decodes large search responses noticeably faster; optional, all Jira
+# responses are decoded through json_loads
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
-# Configuration
-JIRA_URL = os.getenv('JIRA_URL')
-JIRA_EMAIL = os.getenv('JIRA_EMAIL')
-JIRA_API_TOKEN = os.getenv('JIRA_API_TOKEN')
+logger = logging.getLogger(__name__)
+
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+
+# Rate-limited (429) and transient server errors are retried with exponential
+# backoff, honouring Retry-After. Bulk edit POSTs only ADD labels, so retrying
+# them is safe. The last response is returned rather than raised, so callers
+# keep handling error statuses themselves.
+_RETRY = Retry(
+    total=5,
+    backoff_factor=0.5,
+    status_forcelist=[429, 500, 502, 503, 504],
+    allowed_methods=['GET', 'PUT', 'POST'],
+    raise_on_status=False
+)
 
 # Field IDs
 SOURCE_FIELD = 'customfield_10213'  # Numéro de soumission[Short text]
 TARGET_FIELD = 'customfield_10683'  # Liste Numéro de soumission[Labels]
 
-# Validation regex pattern
-VALIDATION_PATTERN = re.compile(r'^S-\d{5,6}$')
+# Validation regex pattern (used with --strict), matched against the whole value
+VALIDATION_PATTERN = re.compile(r'S-\d{5,6}')
+_VALIDATE = VALIDATION_PATTERN.fullmatch
+
+# Bulk edit
+BULK_EDIT_MAX_ISSUES = 1000  # API limit per bulk edit request
+BULK_TASK_PENDING_STATES = {'ENQUEUED', 'RUNNING', 'CANCEL_REQUESTED'}
+BULK_TASK_POLL_INTERVAL = 1  # seconds
+BULK_TASK_MAX_WAIT = 300  # seconds before a task's issues are updated one by one
+
+# Prefetching
+PREFETCH_PUT_TIMEOUT = 0.5  # seconds between checks for a stop request
 
 # JQL Query
+# Only issues whose source value starts with "S-" are fetched. Jira text search
+# is word/prefix based, so values are still validated after fetching.
 JQL_QUERY = '''
 project = es
-AND "Numéro de soumission[Short text]" !~ "S-"
+AND "Numéro de soumission[Short text]" ~ "S-*"
 AND "Liste Numéro de soumission[Labels]" is empty
 AND assignee != 5f6aaf8fad3484006a8038e1
 '''.strip()
 
 
-def fetch_batch(jira: JIRA, jql: str, fields: List[str], batch_size: int = 100) -> List[Any]:
+class IssueStatus(IntEnum):
+    """Outcome of processing a single issue."""
+    UPDATED = 0
+    ERROR = 1
+    DRY_RUN = 2
+
+
+@dataclass
+class JiraCtx:
+    """Connection to the Jira REST API shared by every call."""
+    url: str
+    session: requests.Session  # carries the credentials
+
+
+def fetch_batch(ctx: JiraCtx, jql: str, fields: List[str], batch_size: int = 100,
+                next_page_token: Optional[str] = None) -> Tuple[List[Dict[str, Any]], Optional[str]]:
     """
-    Fetch a single batch of issues from Jira (always from startAt=0).
+    Fetch a single page of issues from Jira.
+
+    Pages are chained with the nextPageToken cursor of the /search/jql
+    endpoint, so every page costs the server the same instead of rescanning
+    the result set from the beginning.
 
-    Since updated issues drop out of the query, we always fetch from the beginning.
-    This ensures stable pagination even when issues are being modified.
+    Issues are returned as the raw JSON dicts from the search response; only
+    a couple of fields are read from each, so wrapping them in jira Issue
+    resources is not worth the cost.
 
     Args:
-        jira: JIRA client instance
+        ctx: Jira connection
         jql: JQL query string
         fields: List of field names to retrieve
         batch_size: Number of issues to fetch (default 100)
+        next_page_token: Token returned with the previous page (None for the first page)
 
     Returns:
-        List of issue objects for this batch
+        Tuple of (raw issue dicts for this page, token for the next page or
+        None on the last page). Unlike the old /search endpoint, /search/jql
+        does not report a total.
     """
-    auth = (JIRA_EMAIL, JIRA_API_TOKEN)
-    url = f"{JIRA_URL}/rest/api/3/search/jql"
+    return _fetch_page(ctx, jql, ','.join(fields), batch_size, next_page_token)
+
+
+def _fetch_page(ctx: JiraCtx, jql: str, fields_param: str, batch_size: int,
+                next_page_token: Optional[str]) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """
+    fetch_batch() with the field names already joined, for callers fetching
+    many pages of the same query.
+    """
+    url = f"{ctx.url}/rest/api/3/search/jql"
 
     params = {
         'jql': jql,
-        'startAt': 0,  # Always fetch from the beginning
         'maxResults': batch_size,
-        'fields': ','.join(fields)
+        'fields': fields_param
     }
+    if next_page_token is not None:
+        params['nextPageToken'] = next_page_token
 
-    response = requests.get(url, auth=auth, params=params)
+    response = ctx.session.get(url, params=params)
 
     if response.status_code != 200:
         raise JIRAError(
@@ -89,260 +146,628 @@ def fetch_batch(jira: JIRA, jql: str, fields: List[str], batch_size: int = 100)
             f"Response: {response.text}"
         )
 
-    data = response.json()
-    issues_data = data.get('issues', [])
-    total = data.get('total', 0)
+    data = json_loads(response.content)
+    return data.get('issues', []), data.get('nextPageToken')
+
+
+def iter_batches(ctx: JiraCtx, jql: str, fields: List[str], batch_size: int,
+                 max_results: Optional[int] = None, rescan: bool = True) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Page through a JQL query, yielding each batch of issues as it arrives.
+
+    Pages are chained with nextPageToken. Updated issues drop out of the
+    query while it is being paged through, which can shift later pages, so
+    once the last page is reached the query is scanned again until a pass
+    turns up no new issue. Issues that are not updated (dry run, invalid
+    values, errors) stay in the query; keys already yielded are skipped, so
+    no issue is processed twice. When nothing is updated (dry run) nothing
+    drops out either, so a single pass is enough.
+
+    Args:
+        ctx: Jira connection
+        jql: JQL query string
+        fields: List of field names to retrieve
+        batch_size: Number of issues to fetch per page
+        max_results: Maximum number of issues to yield (None for all)
+        rescan: If False, stop after the first pass over the query
+
+    Yields:
+        Lists of raw issue dicts not yielded before
+    """
+    processed_keys: Set[str] = set()
+    fields_param = ','.join(fields)
+
+    while True:
+        found = 0
+        token = None
 
-    # Create issue objects from response data
-    batch_issues = []
-    for issue_data in issues_data:
-        issue = Issue(jira._options, jira._session, raw=issue_data)
-        batch_issues.append(issue)
+        while True:
+            current_batch_size = batch_size
+            if max_results:
+                current_batch_size = min(batch_size, max_results - len(processed_keys))
+                if current_batch_size <= 0:
+                    return
 
-    return batch_issues, total
+            logger.info(f"Fetching up to {current_batch_size} issues")
+            batch, token = _fetch_page(
+                ctx, jql, fields_param, batch_size=current_batch_size, next_page_token=token
+            )
+
+            # Jira may return fewer issues per page than requested; use its
+            # page size from then on so batches line up with pages. An empty
+            # page that still has a token says nothing about the page size.
+            if token and 0 < len(batch) < current_batch_size:
+                logger.warning(
+                    f"Jira returned {len(batch)} issues for a page of {current_batch_size}, "
+                    f"using a batch size of {len(batch)}"
+                )
+                batch_size = len(batch)
+
+            new_issues = []
+            for issue in batch:
+                if issue['key'] in processed_keys:
+                    continue
+                processed_keys.add(issue['key'])
+                new_issues.append(issue)
+
+            if new_issues:
+                found += len(new_issues)
+                yield new_issues
+
+            if not token:
+                break
 
+        if not found or not rescan:
+            return
 
-def validate_value(value: str) -> bool:
+
+def prefetch_batches(batch_iter: Iterator[List[Dict[str, Any]]],
+                     batches: queue.Queue, stop: threading.Event) -> None:
     """
-    Validate that a value matches the required pattern.
+    Producer thread fetching batches ahead of the consumer.
+
+    The thread exits once the consumer sets stop, without fetching another
+    page: handing over a batch never blocks for more than
+    PREFETCH_PUT_TIMEOUT without checking it.
 
     Args:
-        value: The value to validate
+        batch_iter: Batches to hand over, typically from iter_batches()
+        batches: Queue receiving batches, or the exception raised while
+            fetching. An empty batch marks the end.
+        stop: Event set by the consumer when no more batches are needed
+    """
+    def hand_over(item) -> bool:
+        while not stop.is_set():
+            try:
+                batches.put(item, timeout=PREFETCH_PUT_TIMEOUT)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    try:
+        for batch in batch_iter:
+            # Stop before fetching the next page if the consumer is done
+            if not hand_over(batch) or stop.is_set():
+                return
+        hand_over([])
+    except Exception as e:
+        hand_over(e)
+
+
+def _wait_for_bulk_task(ctx: JiraCtx, task_id: str) -> dict:
+    """
+    Poll a Jira bulk operation until it reaches a terminal state.
+
+    Polling gives up after BULK_TASK_MAX_WAIT seconds; the task is then
+    returned still pending.
+
+    Args:
+        ctx: Jira connection
+        task_id: ID returned by the bulk edit endpoint
 
     Returns:
-        True if the value matches the pattern ^S-\d{5,6}$, False otherwise
+        Final task progress payload, or the last one seen if the task did not
+        finish in time
     """
-    if not value:
-        return False
-    return bool(VALIDATION_PATTERN.match(value.strip()))
+    url = f"{ctx.url}/rest/api/3/bulk/queue/{task_id}"
+    deadline = time.monotonic() + BULK_TASK_MAX_WAIT
+
+    while True:
+        response = ctx.session.get(url)
 
+        if response.status_code != 200:
+            raise JIRAError(
+                f"Bulk task {task_id} status check failed: HTTP {response.status_code}\n"
+                f"Response: {response.text}",
+                status_code=response.status_code
+            )
 
-def connect_to_jira() -> JIRA:
+        task = json_loads(response.content)
+        if task.get('status') not in BULK_TASK_PENDING_STATES:
+            return task
+
+        if time.monotonic() >= deadline:
+            logger.warning(
+                f"Bulk edit task {task_id} still {task.get('status')} after {BULK_TASK_MAX_WAIT}s, "
+                f"no longer waiting for it"
+            )
+            return task
+
+        time.sleep(BULK_TASK_POLL_INTERVAL)
+
+
+def bulk_update(ctx: JiraCtx, updates: List[Tuple[str, List[str]]]) -> Tuple[List[str], List[str]]:
     """
-    Establish connection to Jira.
+    Add values to the target field of many issues using Jira's bulk edit endpoint.
+
+    The bulk endpoint applies the same value to every selected issue, so issues
+    are grouped by value and one bulk request is sent per group (split into
+    chunks of BULK_EDIT_MAX_ISSUES). A group with a single issue gains nothing
+    from the (asynchronous) bulk endpoint and is left for the regular per-issue
+    update. All bulk tasks are submitted before waiting for any of them, so
+    Jira works through them while the others are being queued. Issues of a
+    request or task that fails, or does not finish in time, are also left for
+    the per-issue update; adding a label that is already set is a no-op.
+
+    Args:
+        ctx: Jira connection
+        updates: List of (issue key, values to add) tuples
 
     Returns:
-        JIRA client instance
+        Tuple of (keys updated in bulk, keys that still need a per-issue update)
+    """
+    url = f"{ctx.url}/rest/api/3/bulk/issues/fields"
+
+    groups: Dict[Tuple[str, ...], List[str]] = {}
+    for key, values in updates:
+        groups.setdefault(tuple(values), []).append(key)
+
+    updated: List[str] = []
+    remaining: List[str] = []
+    submitted: List[Tuple[str, List[str]]] = []
+
+    for values, group_keys in groups.items():
+        if len(group_keys) < 2:
+            remaining.extend(group_keys)
+            continue
+
+        for start in range(0, len(group_keys), BULK_EDIT_MAX_ISSUES):
+            keys = group_keys[start:start + BULK_EDIT_MAX_ISSUES]
+            payload = {
+                'selectedIssueIdsOrKeys': keys,
+                'selectedActions': [TARGET_FIELD],
+                'editedFieldsInput': {
+                    'labelsFields': [{
+                        'fieldId': TARGET_FIELD,
+                        'labels': [{'name': value} for value in values],
+                        'bulkEditMultiSelectFieldOption': 'ADD'
+                    }]
+                },
+                'sendBulkNotification': False
+            }
+
+            try:
+                response = ctx.session.post(url, json=payload)
+            except requests.RequestException as e:
+                logger.warning(
+                    f"Bulk edit of {len(keys)} issues failed ({e}), "
+                    f"falling back to per-issue updates"
+                )
+                remaining.extend(keys)
+                continue
+
+            if response.status_code not in (200, 201):
+                # Rejected (permissions, field configuration...) or still failing
+                # after retries - retry issue by issue
+                logger.warning(
+                    f"Bulk edit of {len(keys)} issues failed (HTTP {response.status_code}), "
+                    f"falling back to per-issue updates"
+                )
+                remaining.extend(keys)
+                continue
+
+            try:
+                task_id = json_loads(response.content)['taskId']
+            except (ValueError, KeyError, TypeError):
+                logger.warning(
+                    f"Bulk edit of {len(keys)} issues returned no task ID "
+                    f"(HTTP {response.status_code}), falling back to per-issue updates"
+                )
+                remaining.extend(keys)
+                continue
+
+            submitted.append((task_id, keys))
+
+    for task_id, keys in submitted:
+        try:
+            task = _wait_for_bulk_task(ctx, task_id)
+        except (JIRAError, requests.RequestException) as e:
+            logger.warning(
+                f"Could not get the status of bulk edit task {task_id} ({e}), "
+                f"falling back to per-issue updates for {len(keys)} issues"
+            )
+            remaining.extend(keys)
+            continue
+
+        if (task.get('status') != 'COMPLETE'
+                or task.get('failedAccessibleIssues')
+                or task.get('invalidOrInaccessibleIssueCount')):
+            logger.warning(
+                f"Bulk edit task {task_id} did not complete cleanly (status {task.get('status')}), "
+                f"falling back to per-issue updates for {len(keys)} issues"
+            )
+            remaining.extend(keys)
+            continue
+
+        updated.extend(keys)
+
+    return updated, remaining
+
+
+def _setup_logging(verbose: bool = False) -> None:
+    """
+    Configure logging for command-line runs.
+
+    Console and file output are buffered and flushed once per batch (or straight
+    away for errors, and warnings on the console) instead of on every line. The
+    log file only records warnings and errors unless verbose, and is opened on
+    first use. Levels are set on the buffering handlers, since a MemoryHandler
+    hands records to its target without checking the target's level.
+
+    Args:
+        verbose: Log every issue processed and write all messages to the file
+    """
+    log_file = logging.FileHandler('bulk_edit.log', mode='a', delay=True)
+    log_file.setFormatter(logging.Formatter(LOG_FORMAT))
+    file_handler = logging.handlers.MemoryHandler(
+        capacity=1000,
+        flushLevel=logging.ERROR,
+        target=log_file
+    )
+    file_handler.setLevel(logging.DEBUG if verbose else logging.WARNING)
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    console_handler = logging.handlers.MemoryHandler(
+        capacity=1000,
+        flushLevel=logging.WARNING,
+        target=stream_handler
+    )
+
+    logging.basicConfig(
+        level=logging.INFO,
+        handlers=[file_handler, console_handler]
+    )
+    if verbose:
+        logger.setLevel(logging.DEBUG)
+
+
+def _create_session(auth: Tuple[str, str], pool_size: int) -> requests.Session:
+    """
+    Create the HTTP session used for every REST call.
+
+    Each request after the first reuses a pooled keep-alive connection instead
+    of a new TCP + TLS handshake.
+
+    Args:
+        auth: (email, API token) for basic authentication
+        pool_size: Number of keep-alive connections kept open to Jira
+
+    Returns:
+        Configured requests session
+    """
+    session = requests.Session()
+    session.auth = auth
+    session.headers['Accept'] = 'application/json'
+    session.mount('https://', HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=pool_size,
+        max_retries=_RETRY
+    ))
+    return session
+
+
+@functools.lru_cache(maxsize=1)
+def connect_to_jira(workers: int = 8) -> JiraCtx:
+    """
+    Set up the connection details for the Jira REST API.
+
+    Credentials are read from the environment (or the .env file). No request
+    is made here; bad credentials surface on the first search. The connection
+    is created once and shared by later calls with the same worker count.
+
+    Args:
+        workers: Number of threads that will send requests concurrently
+
+    Returns:
+        JiraCtx for the configured Jira site
 
     Raises:
         ValueError: If required credentials are missing
-        JIRAError: If connection fails
     """
-    if not all([JIRA_URL, JIRA_EMAIL, JIRA_API_TOKEN]):
+    # Load environment variables
+    load_dotenv()
+    url = os.getenv('JIRA_URL')
+    email = os.getenv('JIRA_EMAIL')
+    api_token = os.getenv('JIRA_API_TOKEN')
+
+    if not all([url, email, api_token]):
         raise ValueError(
             "Missing required credentials. Please set JIRA_URL, JIRA_EMAIL, "
             "and JIRA_API_TOKEN in your .env file"
         )
 
-    logger.info(f"Connecting to Jira at {JIRA_URL}...")
-    try:
-        # Use API v3 (v2 has been deprecated and removed)
-        options = {
-            'server': JIRA_URL,
-            'rest_api_version': '3'
-        }
-        jira = JIRA(
-            options=options,
-            basic_auth=(JIRA_EMAIL, JIRA_API_TOKEN)
+    # Keep one pooled keep-alive connection per worker, plus one for the
+    # prefetching thread, so concurrent requests never pay a new handshake
+    session = _create_session((email, api_token), pool_size=max(16, workers + 1))
+
+    logger.info(f"Using Jira at {url} (API v3)")
+    return JiraCtx(url=url.rstrip('/'), session=session)
+
+
+def _update_issue(ctx: JiraCtx, issue_key: str, operations: Dict[str, List[Dict[str, Any]]]) -> None:
+    """
+    Edit an issue with a direct PUT through the shared session.
+
+    Args:
+        ctx: Jira connection
+        issue_key: Key of the issue to edit
+        operations: Field update operations, e.g. {field_id: [{'add': value}]}
+
+    Raises:
+        JIRAError: If Jira rejects the update
+    """
+    response = ctx.session.put(
+        f"{ctx.url}/rest/api/3/issue/{issue_key}",
+        json={'update': operations}
+    )
+
+    if response.status_code not in (200, 204):
+        raise JIRAError(
+            f"Update failed: HTTP {response.status_code}\n"
+            f"URL: {response.url}\n"
+            f"Response: {response.text}",
+            status_code=response.status_code
         )
-        logger.info("Successfully connected to Jira (using API v3)")
-        return jira
-    except JIRAError as e:
-        logger.error(f"Failed to connect to Jira: {e}")
-        raise
 
 
-def process_issue(jira: JIRA, issue, dry_run: bool = False) -> dict:
+def plan_update(issue: Dict[str, Any], strict: bool = False) -> Optional[str]:
     """
-    Process a single issue by copying validated value from source to target field.
+    Validate an issue and work out the value to add to the target field.
+
+    No API calls are made. Issues that cannot be updated are logged here.
 
     Args:
-        jira: JIRA client instance
-        issue: The Jira issue to process
-        dry_run: If True, don't actually update the issue
+        issue: Raw issue dict from the search response
+        strict: If True, validate the source value with the regex
 
     Returns:
-        Dictionary with processing results
+        The value to add to the target field, or None if the issue can't be updated
     """
-    issue_key = issue.key
-    result = {
-        'key': issue_key,
-        'success': False,
-        'message': '',
-        'source_value': None,
-        'updated': False
-    }
+    issue_key = issue['key']
 
     try:
         # Get source field value
-        source_value = getattr(issue.fields, SOURCE_FIELD, None)
-        result['source_value'] = source_value
+        source_value = issue['fields'].get(SOURCE_FIELD)
 
         if not source_value:
-            result['message'] = f"No value in {SOURCE_FIELD}"
-            logger.info(f"{issue_key}: {result['message']}")
-            return result
+            logger.info("%s: No value in %s", issue_key, SOURCE_FIELD)
+            return None
 
         # Clean and validate the value
         cleaned_value = source_value.strip()
 
-        if not validate_value(cleaned_value):
-            result['message'] = f"Value '{cleaned_value}' does not match pattern ^S-\\d{{5,6}}$"
-            logger.warning(f"{issue_key}: {result['message']}")
-            return result
-
-        # Get current target field value (should be empty based on JQL, but check anyway)
-        current_target = getattr(issue.fields, TARGET_FIELD, None)
-
-        # Prepare the update - target field is a list
-        # For Labels type fields, we need to pass a list of strings
-        new_value = [cleaned_value]
-
-        if current_target:
-            # If there's already a value, we might want to append instead of replace
-            # But based on the JQL query, this should be empty
-            logger.warning(f"{issue_key}: Target field not empty: {current_target}")
-            if cleaned_value not in current_target:
-                new_value = current_target + [cleaned_value]
-            else:
-                result['message'] = f"Value '{cleaned_value}' already exists in target field"
-                logger.info(f"{issue_key}: {result['message']}")
-                result['success'] = True
-                return result
+        # Check ^S-\d{5,6}$ with string methods - much cheaper than the regex
+        # engine, and the prefix test rejects most invalid values straight away.
+        # str.isdecimal() accepts exactly the characters matched by \d.
+        if strict:
+            valid = _VALIDATE(cleaned_value) is not None
+        else:
+            valid = (cleaned_value.startswith('S-')
+                     and 7 <= len(cleaned_value) <= 8
+                     and cleaned_value[2:].isdecimal())
+
+        if not valid:
+            logger.warning("%s: Value '%s' does not match pattern ^S-\\d{5,6}$", issue_key, cleaned_value)
+            return None
+
+        # The target field is not fetched: the JQL only matches issues where it
+        # is empty, and the update adds the label rather than replacing the field,
+        # so a value set in the meantime is kept (and adding an existing label is a no-op)
+        return cleaned_value
+
+    except Exception as e:
+        logger.error("%s: Unexpected error: %s", issue_key, e, exc_info=True)
+        return None
+
+
+def process_issue(ctx: JiraCtx, issue: Dict[str, Any], dry_run: bool = False, value: Optional[str] = None,
+                  strict: bool = False) -> IssueStatus:
+    """
+    Process a single issue by copying validated value from source to target field.
+
+    Args:
+        ctx: Jira connection
+        issue: Raw issue dict from the search response
+        dry_run: If True, don't actually update the issue
+        value: Value returned by a previous plan_update() call for this issue (computed if omitted)
+        strict: If True, validate the source value with the regex
+
+    Returns:
+        IssueStatus for the issue
+    """
+    if value is None:
+        value = plan_update(issue, strict)
+        if value is None:
+            return IssueStatus.ERROR
+
+    issue_key = issue['key']
 
+    try:
         if dry_run:
-            result['message'] = f"[DRY RUN] Would update {TARGET_FIELD} with: {new_value}"
-            result['success'] = True
-            logger.info(f"{issue_key}: {result['message']}")
-            return result
+            logger.info("%s: [DRY RUN] Would add '%s' to %s", issue_key, value, TARGET_FIELD)
+            return IssueStatus.DRY_RUN
 
-        # Update the issue
-        issue.update(fields={TARGET_FIELD: new_value})
+        # Update the issue - Labels fields take an 'add' operation
+        _update_issue(ctx, issue_key, {TARGET_FIELD: [{'add': value}]})
 
-        result['success'] = True
-        result['updated'] = True
-        result['message'] = f"Successfully updated {TARGET_FIELD} with '{cleaned_value}'"
-        logger.info(f"{issue_key}: {result['message']}")
+        logger.info("%s: Successfully updated %s with '%s'", issue_key, TARGET_FIELD, value)
+        return IssueStatus.UPDATED
 
     except JIRAError as e:
-        result['message'] = f"Jira API error: {str(e)}"
-        logger.error(f"{issue_key}: {result['message']}")
+        logger.error("%s: Jira API error: %s", issue_key, e)
     except Exception as e:
-        result['message'] = f"Unexpected error: {str(e)}"
-        logger.error(f"{issue_key}: {result['message']}", exc_info=True)
+        logger.error("%s: Unexpected error: %s", issue_key, e, exc_info=True)
 
-    return result
+    return IssueStatus.ERROR
 
 
-def main(dry_run: bool = False, max_results: Optional[int] = None):
+def main(dry_run: bool = False, max_results: Optional[int] = None, workers: int = 8,
+         strict: bool = False, batch_size: int = 1000):
     """
     Main function using fetch-process-repeat methodology.
 
-    Fetches 100 issues, processes them, then fetches next 100 (from startAt=0).
-    Works because processed issues drop out of the JQL query.
+    Pages through the JQL query batch_size issues at a time and processes each batch.
+    The next batch is prefetched in the background while the current one is
+    being processed; see iter_batches() for how issues that drop out of the
+    query during the run are handled.
 
     Args:
         dry_run: If True, don't actually update issues
         max_results: Maximum number of issues to process (None for all)
+        workers: Number of issues updated concurrently within a batch
+        strict: If True, validate source values with the regex
+        batch_size: Number of issues requested per search page
     """
     logger.info("=" * 80)
     logger.info("Starting Jira Bulk Edit Script")
     logger.info(f"Mode: {'DRY RUN' if dry_run else 'LIVE UPDATE'}")
-    logger.info(f"Methodology: Fetch-Process-Repeat (issues drop out after update)")
+    logger.info(f"Workers: {workers}")
+    logger.info(f"Methodology: Fetch-Process-Repeat (token pagination, prefetched)")
     logger.info("=" * 80)
 
     try:
         # Connect to Jira
-        jira = connect_to_jira()
+        ctx = connect_to_jira(workers)
 
         logger.info(f"Executing JQL query: {JQL_QUERY}")
 
-        # Results tracking
-        results = {
-            'processed': 0,
-            'updated': 0,
-            'skipped': 0,
-            'errors': 0
-        }
+        # Results tracking - only ever touched by this thread, workers just
+        # return an IssueStatus
+        tally: Counter = Counter()
+        processed = 0
 
-        batch_size = 100
         batch_number = 0
 
+        # Batches are fetched by a background thread so the next fetch overlaps
+        # with the updates of the current batch
+        batches: queue.Queue = queue.Queue(maxsize=1)
+        stop = threading.Event()
+        # A dry run updates nothing, so no issue drops out of the query and
+        # there is nothing to rescan for
+        batch_iter = iter_batches(ctx, JQL_QUERY, [SOURCE_FIELD], batch_size, max_results,
+                                  rescan=not dry_run)
+        producer = threading.Thread(
+            target=prefetch_batches,
+            args=(batch_iter, batches, stop),
+            daemon=True
+        )
+        producer.start()
+
         # Keep fetching and processing until done
-        while True:
-            # Check if we've hit the limit
-            if max_results and results['processed'] >= max_results:
-                logger.info(f"Reached max_results limit of {max_results}")
-                break
+        try:
+            while True:
+                # Check if we've hit the limit
+                if max_results and processed >= max_results:
+                    logger.info(f"Reached max_results limit of {max_results}")
+                    break
 
-            batch_number += 1
+                batch = batches.get()
+                if isinstance(batch, Exception):
+                    raise batch
 
-            # Determine how many to fetch
-            if max_results:
-                remaining = max_results - results['processed']
-                current_batch_size = min(batch_size, remaining)
-            else:
-                current_batch_size = batch_size
-
-            # Fetch batch (always from startAt=0)
-            logger.info("")
-            logger.info("=" * 80)
-            logger.info(f"BATCH {batch_number}: Fetching up to {current_batch_size} issues from startAt=0")
-            logger.info("=" * 80)
-
-            batch, total = fetch_batch(
-                jira,
-                JQL_QUERY,
-                fields=[SOURCE_FIELD, TARGET_FIELD, 'summary'],
-                batch_size=current_batch_size
-            )
+                batch_number += 1
 
-            # Log status on first batch
-            if batch_number == 1:
-                if total > 0:
-                    logger.info(f"Total issues currently matching query: {total}")
-                if max_results:
+                # Log status on first batch
+                if batch_number == 1 and max_results:
                     logger.info(f"Will process maximum of {max_results} issues")
 
-            # If no issues, we're done
-            if len(batch) == 0:
-                logger.info("No more issues match the query - all done!")
-                break
-
-            logger.info(f"Fetched {len(batch)} issues in this batch")
-
-            # Process each issue in the batch
-            for idx, issue in enumerate(batch, 1):
-                global_idx = results['processed'] + 1
-                logger.info(f"\n[Batch {batch_number}, Issue {idx}/{len(batch)}] [Total: {global_idx}] Processing: {issue.key} - {issue.fields.summary}")
-                result = process_issue(jira, issue, dry_run)
-
-                results['processed'] += 1
-                if result['success']:
-                    if result['updated']:
-                        results['updated'] += 1
-                    else:
-                        results['skipped'] += 1
-                else:
-                    results['errors'] += 1
-
-            # Show batch summary
-            logger.info("")
-            logger.info("-" * 80)
-            logger.info(f"BATCH {batch_number} COMPLETE")
-            logger.info(f"Processed {len(batch)} issues in this batch")
-            logger.info(f"Total processed so far: {results['processed']}")
-            logger.info(f"  Updated: {results['updated']}, Skipped: {results['skipped']}, Errors: {results['errors']}")
-            logger.info("-" * 80)
+                # If no issues, we're done
+                if len(batch) == 0:
+                    logger.info("No more issues match the query - all done!")
+                    break
+
+                logger.info("")
+                logger.info("=" * 80)
+                logger.info(f"BATCH {batch_number}: Fetched {len(batch)} issues")
+                logger.info("=" * 80)
+
+                # Validate the whole batch first (no API calls)
+                planned = []
+                log_issues = logger.isEnabledFor(logging.DEBUG)
+                for idx, issue in enumerate(batch, 1):
+                    if log_issues:
+                        logger.debug(
+                            "\n[Batch %d, Issue %d/%d] [Total: %d] Processing: %s",
+                            batch_number, idx, len(batch), processed + idx, issue['key']
+                        )
+                    planned.append((issue, plan_update(issue, strict)))
+
+                # Issues sharing the same value are updated with a single bulk edit request
+                bulk_updated = set()
+                if not dry_run:
+                    bulk_keys, _ = bulk_update(
+                        ctx,
+                        [(issue['key'], [value]) for issue, value in planned if value is not None]
+                    )
+                    bulk_updated.update(bulk_keys)
+
+                # Everything else is updated per issue, concurrently - each update is
+                # blocked on HTTP I/O, so several requests can be in flight at once.
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    futures = []
+                    for issue, value in planned:
+                        if value is None:
+                            tally[IssueStatus.ERROR] += 1
+                        elif issue['key'] in bulk_updated:
+                            logger.info("%s: Successfully updated %s with '%s' (bulk edit)", issue['key'], TARGET_FIELD, value)
+                            tally[IssueStatus.UPDATED] += 1
+                        else:
+                            futures.append(executor.submit(process_issue, ctx, issue, dry_run, value))
+
+                    for future in as_completed(futures):
+                        tally[future.result()] += 1
+
+                processed += len(batch)
+
+                # Show batch summary
+                logger.info("")
+                logger.info("-" * 80)
+                logger.info(f"BATCH {batch_number} COMPLETE")
+                logger.info(f"Processed {len(batch)} issues in this batch")
+                logger.info(f"Total processed so far: {processed}")
+                logger.info(
+                    f"  Updated: {tally[IssueStatus.UPDATED]}, "
+                    f"Would update (dry run): {tally[IssueStatus.DRY_RUN]}, "
+                    f"Errors: {tally[IssueStatus.ERROR]}"
+                )
+                logger.info("-" * 80)
+                for handler in logging.getLogger().handlers:
+                    handler.flush()
+        finally:
+            # The producer notices within PREFETCH_PUT_TIMEOUT, or once its
+            # current page has been fetched
+            stop.set()
 
         # Summary
         logger.info("\n" + "=" * 80)
         logger.info("SUMMARY")
         logger.info("=" * 80)
-        logger.info(f"Total issues processed: {results['processed']}")
-        logger.info(f"Successfully updated: {results['updated']}")
-        logger.info(f"Skipped: {results['skipped']}")
-        logger.info(f"Errors: {results['errors']}")
+        logger.info(f"Total issues processed: {processed}")
+        logger.info(f"Successfully updated: {tally[IssueStatus.UPDATED]}")
+        logger.info(f"Would update (dry run): {tally[IssueStatus.DRY_RUN]}")
+        logger.info(f"Errors: {tally[IssueStatus.ERROR]}")
         logger.info("=" * 80)
 
     except Exception as e:
@@ -353,6 +778,16 @@ def main(dry_run: bool = False, max_results: Optional[int] = None):
 if __name__ == '__main__':
     import argparse
 
+    def _positive_int(text: str) -> int:
+        """argparse type accepting integers greater than zero."""
+        try:
+            value = int(text)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"invalid integer: {text!r}")
+        if value <= 0:
+            raise argparse.ArgumentTypeError(f"must be a positive integer, got {value}")
+        return value
+
     parser = argparse.ArgumentParser(
         description='Bulk edit Jira custom fields based on JQL query'
     )
@@ -366,9 +801,34 @@ if __name__ == '__main__':
         type=int,
         help='Maximum number of issues to process (useful for testing or batch processing large numbers)'
     )
+    parser.add_argument(
+        '--batch-size',
+        type=_positive_int,
+        default=1000,
+        help='Number of issues fetched per search page (default: 1000)'
+    )
+    parser.add_argument(
+        '--workers',
+        type=_positive_int,
+        default=8,
+        help='Number of issues to update concurrently (default: 8)'
+    )
+    parser.add_argument(
+        '--strict',
+        action='store_true',
+        help='Validate source values with the regular expression instead of the fast string check'
+    )
+    parser.add_argument(
+        '--verbose',
+        action='store_true',
+        help='Log every issue processed and write all messages to bulk_edit.log '
+             '(default: warnings and errors only in the file)'
+    )
 
     args = parser.parse_args()
 
+    _setup_logging(verbose=args.verbose)
+
     # Always run in dry-run mode first if not explicitly set
     if not args.dry_run:
         confirm = input(
@@ -379,4 +839,5 @@ if __name__ == '__main__':
             logger.info("Operation cancelled by user")
             sys.exit(0)
 
-    main(dry_run=args.dry_run, max_results=args.max_results)
+    main(dry_run=args.dry_run, max_results=args.max_results, workers=args.workers, strict=args.strict,
+         batch_size=args.batch_size)